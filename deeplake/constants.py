@@ -179,6 +179,13 @@ DEFAULT_READONLY = (
     os.environ.get("HUB_DEFAULT_READONLY", "false").strip().lower() == "true"
 )
 
+# If enabled, sample compression during ingest is fanned out over a thread
+# pool. The compression libraries release the GIL, so this scales with cores.
+SERIALIZE_PARALLEL = os.environ.get("HUB_SERIALIZE_PARALLEL", "").strip().lower() in (
+    "1",
+    "true",
+)
+
 _UNLINK_VIDEOS = False
 
 WANDB_INTEGRATION_ENABLED = True
@@ -1,4 +1,6 @@
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import os
 import struct
 import numpy as np
 from typing import List, Optional, Tuple, Union
@@ -47,6 +49,17 @@ from deeplake.core.polygon import Polygons
 from functools import reduce, wraps
 from operator import mul
 
+_SERIALIZE_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def get_serialize_pool() -> ThreadPoolExecutor:
+    """Shared thread pool used to parallelize per-sample compression."""
+    global _SERIALIZE_POOL
+    if _SERIALIZE_POOL is None:
+        _SERIALIZE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _SERIALIZE_POOL
+
+
 InputSample = Union[
     Sample,
     np.ndarray,
@@ -79,12 +92,21 @@ class BaseChunk(DeepLakeMemoryObject):
         self._data_bytes: Union[bytearray, bytes, memoryview, PartialReader] = (
             data or bytearray()
         )
+        self._data_len: Optional[int] = (
+            None
+            if isinstance(self._data_bytes, PartialReader)
+            else len(self._data_bytes)
+        )
         self.version = deeplake.__version__
         self.min_chunk_size = min_chunk_size
         self.max_chunk_size = max_chunk_size
         self.tiling_threshold = tiling_threshold
 
         self.tensor_meta = tensor_meta
+        # dtype/htype are set once on the meta; cache them lazily to avoid
+        # the attribute chain on per-sample serialize paths.
+        self._dtype: Optional[str] = None
+        self._htype: Optional[str] = None
         self.num_dims = (
             1
             if tensor_meta.is_link
@@ -100,6 +122,11 @@ class BaseChunk(DeepLakeMemoryObject):
         self.is_image_compression = compression_type == IMAGE_COMPRESSION
         self.is_video_compression = compression_type == VIDEO_COMPRESSION
         self.is_convert_candidate = self.htype == "image" or self.is_image_compression
+        # bind the per-sample shape hooks once instead of re-evaluating the
+        # convert-candidate predicate on every serialize call
+        self.convert_to_rgb = (
+            self._convert_to_rgb if self.is_convert_candidate else self._shape_noop
+        )
 
         self.shapes_encoder = ShapeEncoder(encoded_shapes)
         self.byte_positions_encoder = BytePositionsEncoder(encoded_byte_positions)
@@ -117,6 +144,10 @@ class BaseChunk(DeepLakeMemoryObject):
         )
         self._item_size = None
         self._sample_size = None
+        self._nbytes_cache: Optional[int] = None
+        # resolved once here; the module attribute chain can't be imported at
+        # module level without a circular import
+        self._tensor_cls = deeplake.core.tensor.Tensor
         self.write_initialization_done = False
         self.id: Optional[str] = None
         self.key: Optional[str] = None
@@ -160,9 +191,13 @@ class BaseChunk(DeepLakeMemoryObject):
     @data_bytes.setter
     def data_bytes(self, value: Union[bytearray, bytes, memoryview, PartialReader]):
         self._data_bytes = value
+        self._data_len = None if isinstance(value, PartialReader) else len(value)
+        self._nbytes_cache = None
 
     @property
     def num_data_bytes(self) -> int:
+        if self._data_len is not None:
+            return self._data_len
         if isinstance(self.data_bytes, PartialReader):
             enc = self.byte_positions_encoder
             num_samples = enc.num_samples
@@ -176,11 +211,17 @@ class BaseChunk(DeepLakeMemoryObject):
 
     @property
     def dtype(self):
-        return self.tensor_meta.dtype
+        dtype = self._dtype
+        if dtype is None:
+            dtype = self._dtype = self.tensor_meta.dtype
+        return dtype
 
     @property
     def htype(self):
-        return self.tensor_meta.htype
+        htype = self._htype
+        if htype is None:
+            htype = self._htype = self.tensor_meta.htype
+        return htype
 
     @property
     def num_samples(self) -> int:
@@ -192,12 +233,14 @@ class BaseChunk(DeepLakeMemoryObject):
     @property
     def nbytes(self):
         """Calculates the number of bytes `tobytes` will be without having to call `tobytes`. Used by `LRUCache` to determine if this chunk can be cached."""
-        return infer_chunk_num_bytes(
-            self.version,
-            self.shapes_encoder.array,
-            self.byte_positions_encoder.array,
-            len_data=self.num_data_bytes,
-        )
+        if self._nbytes_cache is None:
+            self._nbytes_cache = infer_chunk_num_bytes(
+                self.version,
+                self.shapes_encoder.array,
+                self.byte_positions_encoder.array,
+                len_data=self.num_data_bytes,
+            )
+        return self._nbytes_cache
 
     @property
     def header_bytes(self):
@@ -279,16 +322,24 @@ class BaseChunk(DeepLakeMemoryObject):
         """Copies `self.data_bytes` into a bytearray if it is a memoryview."""
         # data_bytes will be a memoryview if frombuffer is called.
         if isinstance(self.data_bytes, PartialReader):
-            chunk_bytes = self.data_bytes.get_all_bytes()
-            self.data_bytes = bytearray(chunk_bytes[self.header_bytes :])
+            self.data_bytes = self.data_bytes.read_tail(self.header_bytes)
         elif isinstance(self.data_bytes, memoryview):
             self.data_bytes = bytearray(self.data_bytes)
 
+    def _ensure_writable(self):
+        """Materializes `self.data_bytes` into a bytearray before an in-place
+        mutation. Called lazily at mutation sites so that write paths which
+        replace `data_bytes` wholesale never pay for copying the old bytes.
+        """
+        self._make_data_bytearray()
+
     def prepare_for_write(self):
         if not self.write_initialization_done:
-            ffw_chunk(self)
+            ffw_chunk(self)  # may rewrite the version header
+            self._nbytes_cache = None
             self.write_initialization_done = True
-        self._make_data_bytearray()
+        if isinstance(self.data_bytes, PartialReader):
+            self._make_data_bytearray()
         self.is_dirty = True
 
     def serialize_sample(
@@ -309,6 +360,23 @@ class BaseChunk(DeepLakeMemoryObject):
         if tiling_threshold < 0:
             break_into_tiles = False
 
+        # fast path for the dominant numeric ingest case, skipping the
+        # isinstance chain below
+        if not self.is_text_like and type(incoming_sample) is np.ndarray:
+            incoming_sample, shape = serialize_numpy_and_base_types(
+                incoming_sample,
+                sample_compression,
+                chunk_compression,
+                dt,
+                ht,
+                tiling_threshold,
+                break_into_tiles,
+                store_uncompressed_tiles,
+            )
+            shape = self.convert_to_rgb(shape)
+            shape = self.normalize_shape(shape)
+            return incoming_sample, shape
+
         if isinstance(incoming_sample, LinkedSample):
             if self.tensor_meta.is_link:
                 incoming_sample = incoming_sample.path
@@ -370,7 +438,7 @@ class BaseChunk(DeepLakeMemoryObject):
                 ht,
                 min_chunk_size,
             )
-        elif isinstance(incoming_sample, deeplake.core.tensor.Tensor):
+        elif isinstance(incoming_sample, self._tensor_cls):
             incoming_sample, shape = serialize_tensor(
                 incoming_sample,
                 sample_compression,
@@ -411,8 +479,12 @@ class BaseChunk(DeepLakeMemoryObject):
         shape = self.normalize_shape(shape)
         return incoming_sample, shape  # type: ignore
 
-    def convert_to_rgb(self, shape):
-        if shape is not None and self.is_convert_candidate and CONVERT_GRAYSCALE:
+    @staticmethod
+    def _shape_noop(shape):
+        return shape
+
+    def _convert_to_rgb(self, shape):
+        if shape is not None and CONVERT_GRAYSCALE:
             ndim = len(shape)
             if self.num_dims is None:
                 self.num_dims = max(3, ndim)
@@ -453,6 +525,7 @@ class BaseChunk(DeepLakeMemoryObject):
         Raises:
             ValueError: If `incoming_num_bytes` is not divisible by `num_samples`.
         """
+        self._nbytes_cache = None
         # incoming_num_bytes is not applicable for image compressions
         if incoming_num_bytes is not None:
             self.byte_positions_encoder.register_samples(
@@ -494,6 +567,7 @@ class BaseChunk(DeepLakeMemoryObject):
         self, local_index: int, sample_nbytes: Optional[int], shape
     ):
         """Updates an existing sample in meta and headers"""
+        self._nbytes_cache = None
         if sample_nbytes is not None:
             self.byte_positions_encoder[local_index] = sample_nbytes
         if shape is not None:
@@ -510,29 +584,33 @@ class BaseChunk(DeepLakeMemoryObject):
             return
         if self.tensor_meta.is_link:
             return
-        max_shape = self.tensor_meta.max_shape
-        if max_shape:
+        expected_dimensionality = self.num_dims
+        if expected_dimensionality is None:
+            max_shape = self.tensor_meta.max_shape
+            if not max_shape:
+                return
             expected_dimensionality = len(max_shape)
-            if expected_dimensionality != len(shape):
-                raise TensorInvalidSampleShapeError(shape, expected_dimensionality)
+        if expected_dimensionality != len(shape):
+            raise TensorInvalidSampleShapeError(shape, expected_dimensionality)
 
     def create_updated_data(self, local_index: int, old_data, new_sample_bytes: bytes):
         if not old_data or self.byte_positions_encoder.is_empty():  # tiled sample
             return new_sample_bytes
         old_start_byte, old_end_byte = self.byte_positions_encoder[local_index]
-        left_data = old_data[:old_start_byte]  # type: ignore
-        right_data = old_data[old_end_byte:]  # type: ignore
+        old_view = memoryview(old_data)  # type: ignore
 
         # preallocate
-        total_new_bytes = len(left_data) + len(new_sample_bytes) + len(right_data)
+        total_new_bytes = (
+            len(old_view) - (old_end_byte - old_start_byte) + len(new_sample_bytes)
+        )
         new_data = bytearray(total_new_bytes)
 
-        # copy old data and add new data
-        new_start_byte = old_start_byte
+        # copy old data and add new data directly from the view,
+        # without materializing intermediate slices
         new_end_byte = old_start_byte + len(new_sample_bytes)
-        new_data[:new_start_byte] = left_data
-        new_data[new_start_byte:new_end_byte] = new_sample_bytes
-        new_data[new_end_byte:] = right_data
+        new_data[:old_start_byte] = old_view[:old_start_byte]
+        new_data[old_start_byte:new_end_byte] = new_sample_bytes
+        new_data[new_end_byte:] = old_view[old_end_byte:]
         return new_data
 
     def normalize_shape(self, shape):
@@ -551,6 +629,8 @@ class BaseChunk(DeepLakeMemoryObject):
 
     def pop_multiple(self, num_samples):
         self.prepare_for_write()
+        self._ensure_writable()
+        self._nbytes_cache = None
 
         if not self.byte_positions_encoder.is_empty():
             total_samples = self.shapes_encoder.num_samples
@@ -583,6 +663,8 @@ class BaseChunk(DeepLakeMemoryObject):
 
     def pop(self, index):
         self.prepare_for_write()
+        self._ensure_writable()
+        self._nbytes_cache = None
         sb, eb = self.byte_positions_encoder[index]
         self.data_bytes = self.data_bytes[:sb] + self.data_bytes[eb:]
         if not self.shapes_encoder.is_empty():
@@ -591,6 +673,7 @@ class BaseChunk(DeepLakeMemoryObject):
             self.byte_positions_encoder.pop(index)
 
     def _fill_empty_shapes(self, shape, num_samples):
+        self._nbytes_cache = None
         dims = len(shape)
         self.num_dims = self.num_dims or dims
         if num_samples > 0:
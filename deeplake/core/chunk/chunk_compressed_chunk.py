@@ -35,6 +35,9 @@ class ChunkCompressedChunk(BaseChunk):
             self.decompressed_samples = decompress_multiple(self._data_bytes, shapes)
         self._changed = False
         self._compression_ratio = 0.5
+        # data_bytes is rewritten wholesale on compression, bypassing the
+        # base setter; disable the cached length and fall back to len().
+        self._data_len = None
 
     def extend_if_has_space(self, incoming_samples: List[InputSample], update_tensor_meta: bool = True, lengths: Optional[List[int]] = None, ignore_errors: bool = False) -> float:  # type: ignore
         self.prepare_for_write()
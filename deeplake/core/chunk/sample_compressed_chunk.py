@@ -1,5 +1,6 @@
 import os
 import struct
+from concurrent.futures import Future
 from typing import List, Optional, Union
 from deeplake.core.compression import decompress_array, decompress_bytes
 from deeplake.core.sample import Sample  # type: ignore
@@ -10,7 +11,13 @@ from deeplake.core.serialize import (
 from deeplake.core.tiling.sample_tiles import SampleTiles
 from deeplake.core.polygon import Polygons
 from deeplake.util.video import normalize_index
-from .base_chunk import BaseChunk, InputSample, catch_chunk_read_error
+from deeplake.constants import SERIALIZE_PARALLEL
+from .base_chunk import (
+    BaseChunk,
+    InputSample,
+    catch_chunk_read_error,
+    get_serialize_pool,
+)
 
 
 class SampleCompressedChunk(BaseChunk):
@@ -21,9 +28,51 @@ class SampleCompressedChunk(BaseChunk):
         compr = self.compression
         skipped: List[int] = []
 
+        futures = None
+        if SERIALIZE_PARALLEL and len(incoming_samples) > 1:
+            pool = get_serialize_pool()
+            # submit a bounded window and refill it as results are consumed: a
+            # chunk consumes at most one chunk's worth of samples before
+            # breaking, so fanning out the whole batch would re-serialize the
+            # remainder once per chunk boundary
+            window = 2 * (os.cpu_count() or 1)
+            futures = {}
+            start = 0
+            if self.num_dims is None:
+                # serialize the first sample on this thread so that num_dims
+                # is initialized deterministically before the worker threads
+                # read it in _convert_to_rgb
+                first: Future = Future()
+                try:
+                    first.set_result(
+                        self.serialize_sample(incoming_samples[0], compr)
+                    )
+                except Exception as e:
+                    first.set_exception(e)
+                futures[0] = first
+                start = 1
+            next_submit = min(start + window, len(incoming_samples))
+            for j in range(start, next_submit):
+                futures[j] = pool.submit(
+                    self.serialize_sample, incoming_samples[j], compr
+                )
+
         for i, incoming_sample in enumerate(incoming_samples):
             try:
-                serialized_sample, shape = self.serialize_sample(incoming_sample, compr)
+                if futures is None:
+                    serialized_sample, shape = self.serialize_sample(
+                        incoming_sample, compr
+                    )
+                else:
+                    future = futures.pop(i)
+                    if next_submit < len(incoming_samples):
+                        futures[next_submit] = pool.submit(
+                            self.serialize_sample,
+                            incoming_samples[next_submit],
+                            compr,
+                        )
+                        next_submit += 1
+                    serialized_sample, shape = future.result()
                 if shape is not None:
                     self.num_dims = self.num_dims or len(shape)
                     check_sample_shape(shape, self.num_dims)
@@ -43,6 +92,7 @@ class SampleCompressedChunk(BaseChunk):
             else:
                 sample_nbytes = len(serialized_sample)
                 if self.is_empty or self.can_fit_sample(sample_nbytes):
+                    self._ensure_writable()
                     self.data_bytes += serialized_sample  # type: ignore
 
                     self.register_in_meta_and_headers(
@@ -55,7 +55,16 @@ class UncompressedChunk(BaseChunk):
         bts = list(
             map(self._text_sample_to_byte_string, incoming_samples[:num_samples])
         )
-        self._data_bytes += b"".join(bts)  # type: ignore
+        self._ensure_writable()
+        # extend the chunk buffer per sample instead of joining into an
+        # intermediate bytes object first
+        data = self._data_bytes
+        if not isinstance(data, bytearray):
+            data = bytearray(data)
+        for i, b in enumerate(bts):
+            lengths[i] = len(b)
+            data += b
+        self.data_bytes = data
         bps = np.zeros((num_samples, 3), dtype=ENCODING_DTYPE)
         enc = self.byte_positions_encoder
         arr = enc._encoded
@@ -70,8 +79,6 @@ class UncompressedChunk(BaseChunk):
             offset = 0
         bps[:, 2] = np.arange(last_seen, num_samples + last_seen)
         bps[0, 1] = offset
-        for i, b in enumerate(bts):
-            lengths[i] = len(b)
         lview = lengths[:num_samples]
         csum = np.cumsum(lengths[: num_samples - 1])
         bps[:, 0] = lview
@@ -139,7 +146,13 @@ class UncompressedChunk(BaseChunk):
                         self.htype,
                     )
             samples = samples.astype(chunk_dtype)
-        self._data_bytes += samples.tobytes()  # type: ignore
+        self._ensure_writable()
+        if samples.nbytes and samples.flags.c_contiguous:
+            # single memcpy of the whole batch, no intermediate bytes object;
+            # cast("B") fails on empty views
+            self.data_bytes += memoryview(samples).cast("B")  # type: ignore
+        else:
+            self.data_bytes += samples.tobytes()  # type: ignore
         self.register_in_meta_and_headers(
             samples[0].nbytes,
             shape,
@@ -157,6 +170,12 @@ class UncompressedChunk(BaseChunk):
         num_samples: float = 0
         skipped: List[int] = []
 
+        # contiguous run of samples with identical shape and nbytes,
+        # registered to the headers in a single encoder update
+        pending_nbytes: Optional[int] = None
+        pending_shape = None
+        pending_count = 0
+
         for i, incoming_sample in enumerate(incoming_samples):
             try:
                 serialized_sample, shape = self.serialize_sample(incoming_sample)
@@ -167,11 +186,18 @@ class UncompressedChunk(BaseChunk):
                 if ignore_errors:
                     skipped.append(i)
                     continue
+                self._register_pending_samples(
+                    pending_nbytes, pending_shape, pending_count, update_tensor_meta
+                )
                 raise
 
             # NOTE re-chunking logic should not reach to this point, for Tiled ones we do not have this logic
             if isinstance(serialized_sample, SampleTiles):
                 incoming_samples[i] = serialized_sample  # type: ignore
+                self._register_pending_samples(
+                    pending_nbytes, pending_shape, pending_count, update_tensor_meta
+                )
+                pending_count = 0
                 if self.is_empty:
                     self.write_tile(serialized_sample)
                     num_samples += 0.5
@@ -179,13 +205,26 @@ class UncompressedChunk(BaseChunk):
             else:
                 sample_nbytes = len(serialized_sample)
                 if self.is_empty or self.can_fit_sample(sample_nbytes):
-                    self._data_bytes += serialized_sample  # type: ignore
+                    self._ensure_writable()
+                    self.data_bytes += serialized_sample  # type: ignore
+
+                    if (
+                        pending_count
+                        and shape == pending_shape
+                        and sample_nbytes == pending_nbytes
+                    ):
+                        pending_count += 1
+                    else:
+                        self._register_pending_samples(
+                            pending_nbytes,
+                            pending_shape,
+                            pending_count,
+                            update_tensor_meta,
+                        )
+                        pending_nbytes = sample_nbytes
+                        pending_shape = shape
+                        pending_count = 1
 
-                    self.register_in_meta_and_headers(
-                        sample_nbytes,
-                        shape,
-                        update_tensor_meta=update_tensor_meta,
-                    )
                     if isinstance(incoming_sample, LinkedTiledSample):
                         num_samples += 0.5
                         break
@@ -194,10 +233,25 @@ class UncompressedChunk(BaseChunk):
                 else:
                     break
 
+        self._register_pending_samples(
+            pending_nbytes, pending_shape, pending_count, update_tensor_meta
+        )
+
         for i in reversed(skipped):
             incoming_samples.pop(i)
         return num_samples
 
+    def _register_pending_samples(
+        self, sample_nbytes, shape, num_samples, update_tensor_meta
+    ):
+        if num_samples:
+            self.register_in_meta_and_headers(
+                sample_nbytes,
+                shape,
+                update_tensor_meta=update_tensor_meta,
+                num_samples=num_samples,
+            )
+
     @catch_chunk_read_error
     def read_sample(
         self,
@@ -269,7 +323,7 @@ class UncompressedChunk(BaseChunk):
         )
 
         old_data = self._data_bytes
-        self._data_bytes = self.create_updated_data(
+        self.data_bytes = self.create_updated_data(
             local_index, old_data, serialized_sample
         )
         self.update_in_meta_and_headers(local_index, new_nb, shape)
@@ -65,7 +65,7 @@ from deeplake.core.meta.encode.sequence import SequenceEncoder
 from deeplake.core.meta.encode.pad import PadEncoder
 from deeplake.core.meta.tensor_meta import TensorMeta
 from deeplake.core.storage.lru_cache import LRUCache
-from deeplake.util.casting import get_dtype, get_htype
+from deeplake.util.casting import downcast_samples, get_dtype, get_htype
 from deeplake.core.sample import Sample
 from deeplake.util.chunk_engine import (
     check_samples_type,
@@ -691,6 +691,8 @@ class ChunkEngine:
         all_empty = all(sample is None for sample in samples)
         if tensor_meta.htype is None and not all_empty:
             tensor_meta.set_htype(get_htype(samples))
+        if tensor_meta.storage_dtype is not None and not all_empty:
+            samples = downcast_samples(samples, tensor_meta.storage_dtype)
         if tensor_meta.dtype is None and not all_empty:
             tensor_meta.set_dtype(
                 get_dtype(next(filter(lambda x: x is not None, samples)))
@@ -1943,7 +1945,9 @@ class ChunkEngine:
         chunk_id, row, worst_case_header_size = self.get_chunk_info(
             global_sample_index, fetch_chunks
         )
-        local_sample_index = enc.translate_index_relative_to_chunks(global_sample_index)
+        local_sample_index = enc.translate_index_relative_to_chunks(
+            global_sample_index, row=row
+        )
         chunk = self.get_chunk_from_chunk_id(
             chunk_id, partial_chunk_bytes=worst_case_header_size
         )
@@ -57,6 +57,14 @@ try:
 except ImportError:
     _NIBABEL_INSTALLED = False
 
+try:
+    from turbojpeg import TurboJPEG, TJPF_GRAY, TJPF_RGB  # type: ignore
+
+    # instantiation fails if the native libjpeg-turbo library is missing
+    _TURBOJPEG: Optional["TurboJPEG"] = TurboJPEG()
+except Exception:
+    _TURBOJPEG = None
+
 if sys.byteorder == "little":
     _NATIVE_INT32 = "<i4"
     _NATIVE_FLOAT32 = "<f4"
@@ -151,6 +159,27 @@ def _decompress_apng(buffer: Union[bytes, memoryview]) -> np.ndarray:
     return ret
 
 
+def _compress_jpeg_turbo(array: np.ndarray) -> Optional[bytes]:
+    """Encodes `array` with libjpeg-turbo, returning ``None`` if the array
+    layout is not supported so the caller can fall back to PIL."""
+    if array.dtype != np.uint8:
+        return None
+    if array.ndim == 3 and array.shape[2] == 1:
+        array = array.squeeze(axis=2)
+    if array.ndim == 2:
+        array, pixel_format = array[:, :, None], TJPF_GRAY
+    elif array.ndim == 3 and array.shape[2] == 3:
+        pixel_format = TJPF_RGB
+    else:
+        return None
+    try:
+        return _TURBOJPEG.encode(  # type: ignore
+            np.ascontiguousarray(array), pixel_format=pixel_format, quality=75
+        )
+    except Exception:
+        return None
+
+
 def compress_bytes(
     buffer: Union[bytes, memoryview], compression: Optional[str]
 ) -> bytes:
@@ -247,6 +276,10 @@ def compress_array(array: np.ndarray, compression: Optional[str]) -> bytes:
         )
     if compression == "apng":
         return _compress_apng(array)
+    if compression == "jpeg" and _TURBOJPEG is not None:
+        compressed_bytes = _compress_jpeg_turbo(array)
+        if compressed_bytes is not None:
+            return compressed_bytes
     try:
         if array.shape == (1, 1, 1):
             array = array[0]
@@ -114,6 +114,7 @@ from deeplake.util.keys import (
     dataset_exists,
     get_dataset_info_key,
     get_dataset_meta_key,
+    get_tensor_meta_key,
     tensor_exists,
     get_queries_key,
     get_queries_lock_key,
@@ -251,6 +252,10 @@ class Dataset:
         d["_temp_tensors"] = []
         d["_vc_info_updated"] = True
         d["_query_string"] = None
+        d["_len_cache"] = None
+        d["_len_cache_key"] = None
+        d["_size_approx_cache"] = None
+        d["_size_approx_cache_key"] = None
         dct = self.__dict__
         dct.update(d)
 
@@ -335,9 +340,44 @@ class Dataset:
         """Returns the client of the dataset."""
         return self._client
 
+    def _raw_tensor_lengths(self) -> List[int]:
+        """Unindexed lengths of all visible tensors. Used as a cheap change
+        detector for the ``__len__`` cache, avoiding the cost of constructing
+        sliced tensor views per call."""
+        version_state = self.version_state
+        tensor_names = version_state["tensor_names"]
+        full_tensors = version_state["full_tensors"]
+        group_index = self.group_index
+        return [
+            full_tensors[
+                tensor_names[posixpath.join(group_index, t)]
+            ].chunk_engine.tensor_length
+            for t in self._all_tensors_filtered(
+                include_hidden=False, include_disabled=False
+            )
+        ]
+
     def __len__(self, warn: bool = True):
         """Returns the length of the smallest tensor."""
-        tensor_lengths = [len(tensor) for tensor in self.tensors.values()]
+        cache_key = tuple(self._raw_tensor_lengths())
+        if cache_key == self._len_cache_key:
+            return self._len_cache
+        if self.index.is_trivial():
+            # a trivial index leaves lengths untouched, so the raw lengths are
+            # the view lengths — skip constructing a tensor view per tensor
+            # but keep the corruption check a full len() would run
+            full_tensors = self.version_state["full_tensors"]
+            tensor_names = self.version_state["tensor_names"]
+            group_index = self.group_index
+            for t in self._all_tensors_filtered(
+                include_hidden=False, include_disabled=False
+            ):
+                full_tensors[
+                    tensor_names[posixpath.join(group_index, t)]
+                ].chunk_engine.validate_num_samples_is_synchronized()
+            tensor_lengths: List[int] = list(cache_key)
+        else:
+            tensor_lengths = [len(tensor) for tensor in self.tensors.values()]
         pad_tensors = self._pad_tensors
         if (
             warn
@@ -350,7 +390,10 @@ class Dataset:
                 "ds.max_len."
             )
         length_fn = max if pad_tensors else min
-        return length_fn(tensor_lengths, default=0)
+        length = length_fn(tensor_lengths, default=0)
+        self._len_cache_key = cache_key
+        self._len_cache = length
+        return length
 
     @property
     def max_len(self):
@@ -395,8 +438,32 @@ class Dataset:
         ]
         state = {k: getattr(self, k) for k in keys}
         state["link_creds"] = self.link_creds
+        state["_unpickle_meta_cache"] = self._meta_cache_for_pickling()
         return state
 
+    def _meta_cache_for_pickling(self) -> Optional[Dict[str, bytes]]:
+        """Raw dataset and tensor meta blobs bundled into the pickled state.
+
+        Unpickling reloads all metas from storage; shipping the (clean) blobs
+        along lets those reads hit the cache instead of the backing store,
+        which matters for dataloader workers that each unpickle a dataset.
+        Returns None if any meta has unflushed changes.
+        """
+        version_state = self.version_state
+        meta = version_state.get("meta")
+        if meta is None or meta.is_dirty:
+            return None
+        commit_id = version_state["commit_id"]
+        cache = {get_dataset_meta_key(commit_id): bytes(meta.tobytes())}
+        for tensor in version_state["full_tensors"].values():
+            tensor_meta = tensor.chunk_engine.tensor_meta
+            if tensor_meta.is_dirty:
+                return None
+            cache[get_tensor_meta_key(tensor.key, commit_id)] = bytes(
+                tensor_meta.tobytes()
+            )
+        return cache
+
     def __setstate__(self, state: Dict[str, Any]):
         """Restores dataset from a pickled state.
 
@@ -417,10 +484,23 @@ class Dataset:
         state["libdeeplake_dataset"] = None
         state["_vc_info_updated"] = False
         state["_locked_out"] = False
+        state["_len_cache"] = None
+        state["_len_cache_key"] = None
+        state["_size_approx_cache"] = None
+        state["_size_approx_cache_key"] = None
+        meta_cache = state.pop("_unpickle_meta_cache", None)
         self.__dict__.update(state)
         self.__dict__["base_storage"] = get_base_storage(self.storage)
         # clear cache while restoring
         self.storage.clear_cache_without_flush()
+        if meta_cache:
+            # seed the cache with the bundled meta blobs so that reloading
+            # derived attributes below doesn't hit the backing store per meta
+            try:
+                for key, blob in meta_cache.items():
+                    self.storage._insert_in_cache(key, blob)
+            except Exception:
+                pass
         self._set_derived_attributes(verbose=False)
         self._indexing_history = []
 
@@ -573,28 +653,56 @@ class Dataset:
                             "Indexing by integer in a for loop, like `for i in range(len(ds)): ... ds[i]` can be quite slow. Use `for i, sample in enumerate(ds)` instead."
                         )
 
-                ret = self.__class__(
-                    storage=self.storage,
-                    index=self.index[item],
-                    group_index=self.group_index,
-                    read_only=self._read_only,
-                    token=self._token,
-                    verbose=False,
-                    version_state=self.version_state,
-                    path=self.path,
-                    is_iteration=is_iteration,
-                    link_creds=self.link_creds,
-                    pad_tensors=self._pad_tensors,
-                    enabled_tensors=self.enabled_tensors,
-                    view_base=self._view_base or self,
-                    libdeeplake_dataset=self.libdeeplake_dataset,
-                )
+                ret = self._view(self.index[item], is_iteration=is_iteration)
         else:
             raise InvalidKeyTypeError(item)
         if hasattr(self, "_view_entry"):
             ret._view_entry = self._view_entry
         return ret
 
+    def _view(self, index: Index, is_iteration: bool = False):
+        """Returns a view over the same tensors differing only in ``index``.
+
+        Shares storage, version state and tensor objects with ``self`` by
+        reference and rebinds just the view-specific state, skipping the full
+        ``__init__`` — locking, read-only negotiation and enabled-tensor
+        resolution were already done when ``self`` was created.
+        """
+        cls = self.__class__
+        ret = cls.__new__(cls)
+        d = self.__dict__.copy()
+        d["index"] = index
+        d["is_iteration"] = is_iteration
+        d["_view_id"] = str(uuid.uuid4())
+        d["_view_base"] = self._view_base or self
+        d["_view_use_parent_commit"] = False
+        d["_update_hooks"] = {}
+        d["_commit_hooks"] = {}
+        d["_checkout_hooks"] = {}
+        d["_initial_autoflush"] = []
+        d["_indexing_history"] = []
+        d["_info"] = None
+        d["_ds_diff"] = None
+        d["_query_string"] = None
+        d["_temp_tensors"] = []
+        d["_len_cache"] = d["_len_cache_key"] = None
+        d["_size_approx_cache"] = d["_size_approx_cache_key"] = None
+        ret.__dict__.update(d)
+        if not self.group_index:
+            ret._reload_version_state()
+        if not is_iteration:
+            group_index = self.group_index
+            group_filter = (
+                lambda t: (not group_index or t.key.startswith(group_index + "/"))
+                and t.key not in self.meta.hidden_tensors
+            )
+            group_tensors = filter(
+                group_filter, self.version_state["full_tensors"].values()
+            )
+            max_tensor_length = max(map(len, group_tensors), default=0)
+            index.validate(max_tensor_length)
+        return ret
+
     def __setitem__(self, item: str, value: Any):
         if not isinstance(item, str):
             raise TypeError("Datasets do not support item assignment")
@@ -818,65 +926,73 @@ class Dataset:
                 else:
                     info_kwargs[k] = htype_config[k]
 
-        create_tensor(
-            key,
-            self.storage,
-            htype=htype,
-            dtype=dtype,
-            sample_compression=sample_compression,
-            chunk_compression=chunk_compression,
-            version_state=self.version_state,
-            hidden=hidden,
-            overwrite=True,
-            **meta_kwargs,
-        )
-        meta: DatasetMeta = self.meta
-        ffw_dataset_meta(meta)
-        meta.add_tensor(name, key, hidden=hidden)
-        tensor = Tensor(key, self)  # type: ignore
-        tensor.meta.name = name
-        self.version_state["full_tensors"][key] = tensor
-        self.version_state["tensor_names"][name] = key
-        if info_kwargs:
-            tensor.info.update(info_kwargs)
-        self.storage.maybe_flush()
-        if create_sample_info_tensor and htype in (
-            "image",
-            "audio",
-            "video",
-            "dicom",
-            "point_cloud",
-            "mesh",
-            "nifti",
-        ):
-            self._create_sample_info_tensor(name)
-        if create_shape_tensor and htype not in ("text", "json"):
-            self._create_sample_shape_tensor(name, htype=htype)
-        if create_id_tensor:
-            self._create_sample_id_tensor(name)
-        if downsampling:
-            downsampling_htypes = {
+        # suppress per-write flushes so the tensor and its companion tensors
+        # (sample info, shape, id, downsampled) are coalesced into the single
+        # flush below instead of one flush per created tensor
+        self._initial_autoflush.append(self.storage.autoflush)
+        self.storage.autoflush = False
+        try:
+            create_tensor(
+                key,
+                self.storage,
+                htype=htype,
+                dtype=dtype,
+                sample_compression=sample_compression,
+                chunk_compression=chunk_compression,
+                version_state=self.version_state,
+                hidden=hidden,
+                overwrite=True,
+                **meta_kwargs,
+            )
+            meta: DatasetMeta = self.meta
+            ffw_dataset_meta(meta)
+            meta.add_tensor(name, key, hidden=hidden)
+            tensor = Tensor(key, self)  # type: ignore
+            tensor.meta.name = name
+            self.version_state["full_tensors"][key] = tensor
+            self.version_state["tensor_names"][name] = key
+            if info_kwargs:
+                tensor.info.update(info_kwargs)
+            if create_sample_info_tensor and htype in (
                 "image",
-                "image.rgb",
-                "image.gray",
-                "binary_mask",
-                "segment_mask",
-            }
-            if htype not in downsampling_htypes:
-                warnings.warn(
-                    f"Downsampling is only supported for tensor with htypes {downsampling_htypes}, got {htype}. Skipping downsampling."
-                )
-            else:
-                self._create_downsampled_tensor(
-                    name,
-                    htype,
-                    dtype,
-                    sample_compression,
-                    chunk_compression,
-                    meta_kwargs,
-                    downsampling_factor,
-                    number_of_layers,
-                )
+                "audio",
+                "video",
+                "dicom",
+                "point_cloud",
+                "mesh",
+                "nifti",
+            ):
+                self._create_sample_info_tensor(name)
+            if create_shape_tensor and htype not in ("text", "json"):
+                self._create_sample_shape_tensor(name, htype=htype)
+            if create_id_tensor:
+                self._create_sample_id_tensor(name)
+            if downsampling:
+                downsampling_htypes = {
+                    "image",
+                    "image.rgb",
+                    "image.gray",
+                    "binary_mask",
+                    "segment_mask",
+                }
+                if htype not in downsampling_htypes:
+                    warnings.warn(
+                        f"Downsampling is only supported for tensor with htypes {downsampling_htypes}, got {htype}. Skipping downsampling."
+                    )
+                else:
+                    self._create_downsampled_tensor(
+                        name,
+                        htype,
+                        dtype,
+                        sample_compression,
+                        chunk_compression,
+                        meta_kwargs,
+                        downsampling_factor,
+                        number_of_layers,
+                    )
+        finally:
+            self.storage.autoflush = self._initial_autoflush.pop()
+        self.storage.maybe_flush()
         return tensor
 
     def _create_sample_shape_tensor(self, tensor: str, htype: str):
@@ -1306,6 +1422,13 @@ class Dataset:
         self.storage.maybe_flush()
 
     def __getattr__(self, key):
+        if key.startswith("__") and key.endswith("__"):
+            # protocol dunder lookups (pickling, copy and notebook probes) can
+            # never be tensors or groups, skip the __getitem__ dispatch; names
+            # that only start with "__" can (e.g. transform temp tensors)
+            raise AttributeError(
+                f"'{self.__class__}' object has no attribute '{key}'"
+            )
         try:
             return self.__getitem__(key)
         except TensorDoesNotExistError as ke:
@@ -1324,10 +1447,37 @@ class Dataset:
 
     def __iter__(self):
         dataset_read(self)
+        is_iteration = not isinstance(self.index.values[0], list)
+        if not is_iteration:
+            for i in range(len(self)):
+                yield self.__getitem__(i, is_iteration=False)
+            return
+        # hoist everything that is invariant across samples and construct the
+        # per-sample views directly, skipping __getitem__'s type dispatch and
+        # indexing-history bookkeeping on every iteration
+        cls = self.__class__
+        index = self.index
+        view_entry = getattr(self, "_view_entry", None)
+        kwargs = dict(
+            storage=self.storage,
+            group_index=self.group_index,
+            read_only=self._read_only,
+            token=self._token,
+            verbose=False,
+            version_state=self.version_state,
+            path=self.path,
+            is_iteration=True,
+            link_creds=self.link_creds,
+            pad_tensors=self._pad_tensors,
+            enabled_tensors=self.enabled_tensors,
+            view_base=self._view_base or self,
+            libdeeplake_dataset=self.libdeeplake_dataset,
+        )
         for i in range(len(self)):
-            yield self.__getitem__(
-                i, is_iteration=not isinstance(self.index.values[0], list)
-            )
+            ret = cls(index=index[i], **kwargs)
+            if view_entry is not None:
+                ret._view_entry = view_entry
+            yield ret
 
     def _get_commit_id_for_address(self, address, version_state):
         if address in version_state["branch_commit_map"]:
@@ -2499,9 +2649,14 @@ class Dataset:
         """
         tensors = self.version_state["full_tensors"].values()
         chunk_engines = [tensor.chunk_engine for tensor in tensors]
+        cache_key = tuple(c.num_chunks for c in chunk_engines)
+        if cache_key == self._size_approx_cache_key:
+            return self._size_approx_cache
         size = sum(c.num_chunks * c.min_chunk_size for c in chunk_engines)
         for group in self._groups_filtered:
             size += self[group].size_approx()
+        self._size_approx_cache_key = cache_key
+        self._size_approx_cache = size
         return size
 
     @invalid_view_op
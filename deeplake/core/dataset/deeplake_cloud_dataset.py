@@ -51,7 +51,11 @@ class DeepLakeCloudDataset(Dataset):
         """Datasets that are connected to Deep Lake cloud can still technically be stored anywhere.
         If a dataset is in Deep Lake cloud but stored without ``hub://`` prefix, it should only be used for testing.
         """
-        return is_hub_cloud_path(self.path)  # type: ignore
+        cached = self.__dict__.get("_is_actually_cloud")
+        if cached is None:
+            cached = is_hub_cloud_path(self.path)  # type: ignore
+            self.__dict__["_is_actually_cloud"] = cached
+        return cached
 
     @property
     def token(self):
@@ -61,9 +65,9 @@ class DeepLakeCloudDataset(Dataset):
         return self._token
 
     def _set_org_and_name(self):
+        if self.org_id is not None and self.ds_name is not None:
+            return
         if self.is_actually_cloud:
-            if self.org_id is not None and self.ds_name is not None:
-                return
             _, org_id, ds_name, subdir = process_hub_path(self.path)
             if subdir:
                 ds_name += "/" + subdir
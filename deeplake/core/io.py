@@ -350,7 +350,24 @@ class SampleStreaming(Streaming):
         for block in schedule._blocks:
             yield from self.stream(block)
 
+    def _prefetch_block_chunks(self, block: IOBlock):
+        """Warms each engine's cache with the block's chunks in one batched
+        storage fetch instead of one read per chunk in the sample loop."""
+        for keyid, (key, engine) in enumerate(self.chunk_engines.items()):
+            chunk_keys = []
+            for c_name in set(block.chunk_names(keyid)):
+                if c_name is None:
+                    continue
+                commit_id, tkey = engine.get_chunk_commit(c_name)
+                chunk_keys.append(get_chunk_key(tkey, c_name, commit_id))
+            if chunk_keys:
+                engine.cache.prefetch(chunk_keys)
+
     def stream(self, block: IOBlock):
+        try:
+            self._prefetch_block_chunks(block)
+        except Exception:
+            pass  # prefetching is best effort, the sample loop fetches anyway
         htype_dict, ndim_dict, tensor_info_dict = (
             self.htype_dict,
             self.ndim_dict,
@@ -425,18 +442,6 @@ class SampleStreaming(Streaming):
                     )
                 yield sample
 
-    def _get_block_for_single_sample(self, idx):
-        chunks = []
-        for engine in self.chunk_engines.values():
-            enc = engine.chunk_id_encoder
-            try:
-                cids = enc[idx]
-                cnames = list(map(enc.name_from_id, cids))
-                chunks.append(cnames)
-            except Exception:
-                chunks.append([None])
-        return IOBlock(chunks, [idx])
-
     def _is_continuious(self):
         idx_entry = self.dataset.index.values[0]
         if isinstance(idx_entry.value, slice):
@@ -458,7 +463,23 @@ class SampleStreaming(Streaming):
         return self.list_blocks_random()
 
     def list_blocks_random(self) -> List[IOBlock]:
-        return list(map(self._get_block_for_single_sample, self._get_dataset_indices()))
+        indices = list(self._get_dataset_indices())
+        per_engine: List[List[List[Optional[str]]]] = []
+        for engine in self.chunk_engines.values():
+            enc = engine.chunk_id_encoder
+            try:
+                name_from_id = enc.name_from_id
+                cnames: List[List[Optional[str]]] = [
+                    [None] if cids is None else [name_from_id(cid) for cid in cids]
+                    for cids in enc.lookup_many(indices)
+                ]
+            except Exception:
+                cnames = [[None]] * len(indices)
+            per_engine.append(cnames)
+        return [
+            IOBlock([cnames[i] for cnames in per_engine], [idx])
+            for i, idx in enumerate(indices)
+        ]
 
     def _intersection(self, index, low, high):
         if isinstance(index, slice):
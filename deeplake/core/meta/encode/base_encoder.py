@@ -96,7 +96,9 @@ class Encoder(ABC):
     def num_samples(self) -> int:
         if len(self._encoded) == 0:
             return 0
-        return int(self._encoded[-1, LAST_SEEN_INDEX_COLUMN] + 1)
+        # add in python ints so the chunk id encoder's "no samples yet"
+        # sentinel (the unsigned max) doesn't wrap back to 0
+        return int(self._encoded[-1, LAST_SEEN_INDEX_COLUMN]) + 1
 
     def num_samples_at(self, row_index: int) -> int:
         """Calculates the number of samples a row in the encoding corresponds to.
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, List, Tuple, Optional
 from deeplake.core.meta.encode.base_encoder import Encoder, LAST_SEEN_INDEX_COLUMN
 from deeplake.constants import ENCODING_DTYPE
@@ -14,16 +15,66 @@ from deeplake.util.generate_id import generate_id
 CHUNK_ID_COLUMN = 0
 
 
+@lru_cache(maxsize=2**14)
+def _name_from_id_cached(id: int) -> str:
+    return hex(id)[2:]
+
+
 class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
     def __init__(self, encoded=None, dtype=ENCODING_DTYPE):
+        self._tobytes_cache: Optional[memoryview] = None
         super().__init__(encoded, dtype)
 
+    @property
+    def is_dirty(self):
+        return self._is_dirty
+
+    @is_dirty.setter
+    def is_dirty(self, value):
+        # every mutation marks the encoder dirty (otherwise it would never be
+        # flushed), so this doubles as the serialization cache invalidation
+        if value:
+            self._tobytes_cache = None
+        self._is_dirty = value
+
+    @property
+    def _encoded(self):
+        buf = self._buf
+        if self._length != len(buf):
+            return buf[: self._length]
+        return buf
+
+    @_encoded.setter
+    def _encoded(self, arr):
+        # rows are appended with amortized growth through _append_row; any
+        # wholesale assignment (insert/delete/deserialize) resets the buffer
+        self._buf = arr
+        self._length = len(arr)
+
+    def _append_row(self, chunk_id, last_index):
+        """Appends a row to the encoder, doubling the backing buffer when it
+        is full instead of concatenating (and copying) on every append.
+
+        The buffer is column-major so that the last-seen-index column binary
+        searched by `translate_index` is a contiguous view."""
+        buf, length = self._buf, self._length
+        if length == len(buf):
+            new_buf = np.empty((max(length * 2, 8), 2), dtype=self.dtype, order="F")
+            new_buf[:length] = buf
+            self._buf = buf = new_buf
+        buf[length] = (chunk_id, last_index)
+        self._length = length + 1
+
     @staticmethod
     def name_from_id(id) -> str:
         """Returns the hex of `id` with the "0x" prefix removed. This is the chunk's name and should be used to determine the chunk's key.
         Can convert back into `id` using `id_from_name`. You can get the `id` for a chunk using `__getitem__`.
+
+        Results are memoized: the hex formatting (and the numpy scalar to int
+        conversion it triggers) runs once per chunk id instead of on every
+        chunk access.
         """
-        return hex(id)[2:]
+        return _name_from_id_cached(int(id))
 
     @staticmethod
     def id_from_name(name: str):
@@ -33,20 +84,20 @@ class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
     def get_name_for_chunk(self, chunk_index: int) -> str:
         """Gets the name for the chunk at index `chunk_index`. If you need to get the name for a chunk from a sample index, instead
         use `__getitem__`, then `name_from_id`."""
-        chunk_id = self._encoded[:, CHUNK_ID_COLUMN][chunk_index]
+        chunk_id = self._encoded[chunk_index, CHUNK_ID_COLUMN]
         return ChunkIdEncoder.name_from_id(chunk_id)
 
     def get_id_for_chunk(self, chunk_index: int) -> str:
         """Gets the if for the chunk at index `chunk_index`. If you need to get the name for a chunk from a sample index, instead
         use `__getitem__`, then `name_from_id`."""
 
-        return self._encoded[:, CHUNK_ID_COLUMN][chunk_index]
+        return self._encoded[chunk_index, CHUNK_ID_COLUMN]
 
     @property
     def num_chunks(self) -> int:
         if self.num_samples == 0:
             return 0
-        return len(self._encoded)
+        return self._length
 
     def get_next_chunk_id(self, row) -> Optional[str]:
         if (
@@ -119,7 +170,10 @@ class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
         chunk_id = generate_id(self.dtype)
         if register:
             if self.num_samples == 0:
-                self._encoded = np.array([[chunk_id, -1]], dtype=self.dtype)
+                # -1 ("no samples yet") as the unsigned max; numpy no longer
+                # wraps out-of-range python ints on array creation
+                no_samples = np.iinfo(self.dtype).max
+                self._encoded = np.array([[chunk_id, no_samples]], dtype=self.dtype)
 
             else:
                 if row is not None and row < self.num_chunks:
@@ -131,12 +185,7 @@ class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
                 if row is not None and row != self.num_chunks:
                     raise OutOfChunkCountError()
                 last_index = self.num_samples - 1
-
-                new_entry = np.array(
-                    [[chunk_id, last_index]],
-                    dtype=self.dtype,
-                )
-                self._encoded = np.concatenate([self._encoded, new_entry])
+                self._append_row(chunk_id, last_index)
         return chunk_id
 
     def register_samples(self, num_samples: int, row: Optional[int] = None):  # type: ignore
@@ -155,7 +204,9 @@ class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
 
         super().register_samples(None, num_samples, row=row)
 
-    def translate_index_relative_to_chunks(self, global_sample_index: int) -> int:
+    def translate_index_relative_to_chunks(
+        self, global_sample_index: int, row: Optional[int] = None
+    ) -> int:
         """Converts `global_sample_index` into a new index that is relative to the chunk the sample belongs to.
 
         Example:
@@ -177,16 +228,20 @@ class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
 
         Args:
             global_sample_index (int): Index of the sample relative to the containing tensor.
+            row (int, Optional): Row of the chunk containing the sample, if already
+                known from a previous lookup. Skips the binary search.
 
         Returns:
             int: local index value between 0 and the amount of samples the chunk contains - 1.
         """
 
-        ls = self.__getitem__(global_sample_index, return_row_index=True)  # type: ignore
-        assert len(ls) == 1, len(
-            ls
-        )  # this method should only be called for non tiled samples
-        chunk_index = ls[0][1]
+        if row is None:
+            ls = self.__getitem__(global_sample_index, return_row_index=True)  # type: ignore
+            assert len(ls) == 1, len(
+                ls
+            )  # this method should only be called for non tiled samples
+            row = ls[0][1]
+        chunk_index = row
 
         if chunk_index == 0:
             return global_sample_index
@@ -215,12 +270,14 @@ class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
         # note: do not call super() method (num_samples can be 0)
 
     def _derive_next_last_index(self, last_index, num_samples: int):
-        # this operation will trigger an overflow for the first addition, so supress the warning
-        np.seterr(over="ignore")
-        new_last_index = last_index + self.dtype(num_samples)
-        np.seterr(over="warn")
-
-        return new_last_index
+        # a fresh chunk is registered with the "no samples yet" sentinel (-1
+        # stored as the unsigned max); doing the wraparound in Python ints
+        # avoids toggling numpy's global overflow state on every registration
+        next_last_index = int(last_index) + num_samples
+        max_val = int(np.iinfo(self.dtype).max)
+        if next_last_index > max_val:
+            next_last_index -= max_val + 1
+        return self.dtype(next_last_index)
 
     def _combine_condition(self, *args) -> bool:
         """Always returns True because sample registration can always be done. Used in base encoder `register_samples`."""
@@ -278,6 +335,33 @@ class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
                 break
         return output
 
+    def lookup_many(self, sample_indices):
+        """Resolves chunk ids for many sample indices with a single vectorized
+        binary search instead of one `__getitem__` call per sample.
+
+        Args:
+            sample_indices: Sequence of non-negative sample indices.
+
+        Yields:
+            List of chunk ids per sample index (more than one for tiled
+            samples), matching `__getitem__` output. ``None`` is yielded for
+            indices that are out of bounds.
+        """
+        arr = self._encoded
+        nrows = len(arr)
+        last_seen = arr[:, LAST_SEEN_INDEX_COLUMN]
+        rows = np.searchsorted(last_seen, sample_indices)
+        for sample_index, row_index in zip(sample_indices, rows):
+            if row_index >= nrows:
+                yield None
+                continue
+            ids = [arr[row_index, CHUNK_ID_COLUMN]]
+            row_index += 1
+            while row_index < nrows and last_seen[row_index] == sample_index:
+                ids.append(arr[row_index, CHUNK_ID_COLUMN])
+                row_index += 1
+            yield ids
+
     def _num_samples_in_last_chunk(self):
         return self._num_samples_in_last_row()
 
@@ -347,4 +431,6 @@ class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
         return instance
 
     def tobytes(self) -> memoryview:
-        return serialize_chunkids(self.version, self._encoded)
+        if self._tobytes_cache is None:
+            self._tobytes_cache = serialize_chunkids(self.version, self._encoded)
+        return self._tobytes_cache
@@ -33,6 +33,7 @@ class TensorMeta(Meta):
     name: Optional[str] = None
     htype: str
     dtype: str
+    storage_dtype: Optional[str] = None
     typestr: str
     min_shape: List[int]
     max_shape: List[int]
@@ -106,6 +107,20 @@ class TensorMeta(Meta):
         self.dtype = dtype_name
         self.is_dirty = True
 
+    def set_storage_dtype(self, dtype_name: str):
+        """Opt in to downcasting wider float samples to `dtype_name` at ingest.
+
+        Should be set before the first sample is added. Incoming float samples
+        wider than this dtype are cast down before being stored, halving (or
+        better) the bytes written for float tensors.
+
+        Only applies to ndarrays and Python floats (including inside a flat
+        list or tuple); samples wrapped with `deeplake.read`/`Sample` are
+        stored at their native width.
+        """
+        self.storage_dtype = np.dtype(dtype_name).name
+        self.is_dirty = True
+
     def set_htype(self, htype: str, **kwargs):
         """Set htype of tensor. Should only be called once."""
 
@@ -179,6 +194,8 @@ class TensorMeta(Meta):
         for key in self._required_meta_keys:
             d[key] = getattr(self, key)
         d["name"] = self.name
+        if self.storage_dtype is not None:
+            d["storage_dtype"] = self.storage_dtype
 
         return d
 
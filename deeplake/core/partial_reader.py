@@ -23,3 +23,12 @@ class PartialReader:
 
     def get_all_bytes(self) -> bytes:
         return self.cache.next_storage[self.path]
+
+    def read_tail(self, offset: int) -> bytearray:
+        """Reads everything past ``offset`` into a caller-owned bytearray,
+        skipping the intermediate full-object bytes allocation of
+        ``get_all_bytes``."""
+        storage = self.cache.next_storage
+        buffer = bytearray(storage.get_object_size(self.path) - offset)
+        storage.read_into(self.path, buffer, offset)
+        return buffer
@@ -108,16 +108,24 @@ def write_version(version, buffer) -> int:
     return offset
 
 
+def _write_array(arr: np.ndarray, buffer, offset) -> int:
+    """Copies an array's bytes into the buffer without an intermediate
+    `tobytes` allocation when the array is contiguous."""
+    nbytes = arr.nbytes
+    if nbytes and arr.flags.c_contiguous:  # cast("B") fails on empty views
+        buffer[offset : offset + nbytes] = memoryview(arr).cast("B")
+    else:
+        buffer[offset : offset + nbytes] = arr.tobytes()
+    return offset + nbytes
+
+
 def write_shape_info(shape_info, buffer, offset) -> int:
     """Writes shape info to the buffer, takes offset into account and returns updated offset."""
     if shape_info.ndim == 1:
         offset += 8
     else:
-        buffer[offset : offset + 8] = struct.pack("<ii", *shape_info.shape)
-        offset += 8
-
-        buffer[offset : offset + shape_info.nbytes] = shape_info.tobytes()
-        offset += shape_info.nbytes
+        struct.pack_into("<ii", buffer, offset, *shape_info.shape)
+        offset = _write_array(shape_info, buffer, offset + 8)
     return offset
 
 
@@ -127,10 +135,7 @@ def write_byte_positions(byte_positions, buffer, offset) -> int:
         offset += 4
     else:
         buffer[offset : offset + 4] = byte_positions.shape[0].to_bytes(4, "little")
-        offset += 4
-
-        buffer[offset : offset + byte_positions.nbytes] = byte_positions.tobytes()
-        offset += byte_positions.nbytes
+        offset = _write_array(byte_positions, buffer, offset + 4)
     return offset
 
 
@@ -368,8 +373,7 @@ def serialize_chunkids(version: str, arr: np.ndarray) -> memoryview:
         offset += 1
 
     # Write ids
-    flatbuff[offset : offset + arr.nbytes] = arr.tobytes()
-    offset += arr.nbytes
+    offset = _write_array(arr, flatbuff, offset)
     return memoryview(flatbuff)
 
 
@@ -499,6 +503,12 @@ def serialize_text(
     htype: str,
 ):
     """Converts the sample into bytes"""
+    if htype == "text" and isinstance(incoming_sample, str):
+        # dominant ingest case, skip the text_to_bytes dispatch
+        incoming_sample, shape = incoming_sample.encode(), (1,)
+        if sample_compression:
+            incoming_sample = compress_bytes(incoming_sample, sample_compression)
+        return incoming_sample, shape
     if isinstance(incoming_sample, deeplake.core.tensor.Tensor):
         try:
             if (
@@ -535,7 +545,15 @@ def serialize_numpy_and_base_types(
     store_tiles: bool = False,
 ):
     """Converts the sample into bytes"""
-    out = intelligent_cast(incoming_sample, dtype, htype)
+    if (
+        isinstance(incoming_sample, np.ndarray)
+        and incoming_sample.dtype == np.dtype(dtype)
+        and incoming_sample.flags.c_contiguous
+    ):
+        # dtype already matches, skip casting checks on the hot ingest path
+        out = incoming_sample
+    else:
+        out = intelligent_cast(incoming_sample, dtype, htype)
     shape = out.shape
     tile_compression = chunk_compression or sample_compression
 
@@ -106,6 +106,9 @@ class AzureProvider(StorageProvider):
     def __getitem__(self, path):
         return self.get_bytes(path)
 
+    def get_items(self, paths):
+        return self._get_items_threaded(paths)
+
     def __delitem__(self, path):
         self.check_readonly()
         blob_client = self.container_client.get_blob_client(
@@ -383,6 +383,9 @@ class GCSProvider(StorageProvider):
         """Retrieve data."""
         return self.get_bytes(key)
 
+    def get_items(self, paths):
+        return self._get_items_threaded(paths)
+
     def get_bytes(
         self,
         path: str,
@@ -215,6 +215,42 @@ class LRUCache(StorageProvider):
                 return result
             raise KeyError(path)
 
+    def get_items(self, paths):
+        """Gets the objects present at multiple paths. Paths already cached are
+        served from the cache; the rest are fetched from the underlying storage
+        with a single batched call. Missing paths are omitted from the result.
+        """
+        items = {}
+        missing = []
+        for path in paths:
+            if path in self.deeplake_objects or path in self.lru_sizes:
+                items[path] = self[path]
+            else:
+                missing.append(path)
+        if missing and self.next_storage is not None:
+            fetched = self.next_storage.get_items(missing)
+            for path, result in fetched.items():
+                if _get_nbytes(result) <= self.cache_size:
+                    self._insert_in_cache(path, result)
+            items.update(fetched)
+        return items
+
+    def prefetch(self, paths):
+        """Warms the cache with the given paths using one batched fetch from
+        the underlying storage instead of a round trip per path. Paths already
+        cached or not present in the storage are skipped."""
+        self.get_items([path for path in paths if path not in self.dirty_keys])
+
+    def read_into(self, path: str, buffer, start_byte: int = 0) -> int:
+        """Reads the object at the path into a caller-owned buffer. Cached
+        objects are copied from the cache; otherwise the read is delegated to
+        the underlying storage, which may fill the buffer directly."""
+        if path in self.deeplake_objects or path in self.lru_sizes:
+            return super().read_into(path, buffer, start_byte)
+        if self.next_storage is not None:
+            return self.next_storage.read_into(path, buffer, start_byte)
+        raise KeyError(path)
+
     def get_bytes(
         self,
         path: str,
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Set, Sequence, Dict
 
 from deeplake.constants import BYTE_PADDING
@@ -72,6 +73,61 @@ class StorageProvider(ABC, MutableMapping):
         assert_byte_indexes(start_byte, end_byte)
         return self[path][start_byte:end_byte]
 
+    def get_items(self, paths: Sequence[str]) -> Dict[str, bytes]:
+        """Gets the objects present at multiple paths. Paths with no object are
+        omitted from the result. Providers with per-request network latency
+        override this to fetch the paths concurrently.
+
+        Args:
+            paths (Sequence[str]): The paths relative to the root of the provider.
+
+        Returns:
+            Dict[str, bytes]: Mapping of path to the object found at it.
+        """
+        items = {}
+        for path in paths:
+            try:
+                items[path] = self[path]
+            except KeyError:
+                pass
+        return items
+
+    def read_into(self, path: str, buffer, start_byte: int = 0) -> int:
+        """Reads the object at the path into a caller-owned preallocated
+        ``buffer``, starting from ``start_byte``. File-backed providers
+        override this to read directly into the buffer without building an
+        intermediate bytes object.
+
+        Args:
+            path (str): The path relative to the root of the provider.
+            buffer: A writable buffer. At most ``len(buffer)`` bytes are read.
+            start_byte (int): Offset within the object to start reading from.
+
+        Returns:
+            int: Number of bytes written into ``buffer``.
+        """
+        data = self.get_bytes(path, start_byte, start_byte + len(buffer))
+        nbytes = len(data)
+        buffer[:nbytes] = data
+        return nbytes
+
+    def _get_items_threaded(self, paths: Sequence[str]) -> Dict[str, bytes]:
+        """`get_items` implementation for remote providers: fetches the paths
+        concurrently so the total latency is one round trip, not one per path."""
+        paths = list(paths)
+        if len(paths) <= 1:
+            return StorageProvider.get_items(self, paths)
+
+        def fetch(path):
+            try:
+                return path, self[path]
+            except KeyError:
+                return path, None
+
+        with ThreadPoolExecutor(max_workers=min(len(paths), 16)) as executor:
+            results = executor.map(fetch, paths)
+        return {path: value for path, value in results if value is not None}
+
     @abstractmethod
     def __setitem__(self, path: str, value: bytes):
         """Sets the object present at the path with the value
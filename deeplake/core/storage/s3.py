@@ -217,6 +217,9 @@ class S3Provider(StorageProvider):
         """
         return self.get_bytes(path)
 
+    def get_items(self, paths):
+        return self._get_items_threaded(paths)
+
     def _get_bytes(
         self, path, start_byte: Optional[int] = None, end_byte: Optional[int] = None
     ):
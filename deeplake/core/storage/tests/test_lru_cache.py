@@ -1,6 +1,8 @@
 import pytest
 
 from deeplake.core import LRUCache, MemoryProvider
+from deeplake.core.meta.encode.chunk_id import ChunkIdEncoder
+from deeplake.core.partial_reader import PartialReader
 
 
 def test_simple_caching():
@@ -86,3 +88,55 @@ def test_get_bytes():
         )
 
     assert list(cache_ds.dict.keys()) == []
+
+
+def test_read_into():
+    real_ds = MemoryProvider()
+    real_ds["a/value"] = bytes("abcdefg", "utf-8")
+    cache_ds = MemoryProvider()
+    lru_cache = LRUCache(cache_storage=cache_ds, next_storage=real_ds, cache_size=100)
+
+    # uncached path: delegated to next_storage without populating the cache
+    buffer = bytearray(7)
+    assert lru_cache.read_into("a/value", buffer) == 7
+    assert bytes(buffer) == b"abcdefg"
+    assert len(cache_ds) == 0
+
+    # cached raw bytes: served from the cache, honoring the offset
+    lru_cache["a/value"]
+    assert "a/value" in lru_cache.lru_sizes
+    buffer = bytearray(4)
+    assert lru_cache.read_into("a/value", buffer, start_byte=3) == 4
+    assert bytes(buffer) == b"defg"
+
+    # registered deeplake object: copied from its serialized form
+    enc = ChunkIdEncoder()
+    enc.generate_chunk_id(10, 1)
+    lru_cache.register_deeplake_object("a/enc", enc)
+    expected = enc.tobytes()
+    buffer = bytearray(len(expected))
+    assert lru_cache.read_into("a/enc", buffer) == len(expected)
+    assert bytes(buffer) == bytes(expected)
+
+    with pytest.raises(KeyError):
+        lru_cache.read_into("a/missing", bytearray(1))
+
+    # no next storage to fall back to
+    lone_cache = LRUCache(cache_storage=MemoryProvider(), next_storage=None, cache_size=100)
+    with pytest.raises(KeyError):
+        lone_cache.read_into("a/value", bytearray(1))
+
+
+def test_partial_reader_read_tail():
+    real_ds = MemoryProvider()
+    real_ds["a/chunk"] = bytes("0123456789", "utf-8")
+    lru_cache = LRUCache(
+        cache_storage=MemoryProvider(), next_storage=real_ds, cache_size=100
+    )
+
+    reader = PartialReader(lru_cache, "a/chunk", header_offset=0)
+    tail = reader.read_tail(4)
+    assert isinstance(tail, bytearray)
+    assert bytes(tail) == reader.get_all_bytes()[4:]
+
+    assert bytes(reader.read_tail(0)) == b"0123456789"
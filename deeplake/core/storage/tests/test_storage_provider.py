@@ -55,6 +55,37 @@ def check_storage_provider(storage):
     storage.flush()
 
 
+def check_read_into(storage):
+    FILE_1 = f"{KEY}_1"
+    storage[FILE_1] = b"hello world"
+
+    buffer = bytearray(11)
+    assert storage.read_into(FILE_1, buffer) == 11
+    assert bytes(buffer) == b"hello world"
+
+    buffer = bytearray(5)
+    assert storage.read_into(FILE_1, buffer, start_byte=6) == 5
+    assert bytes(buffer) == b"world"
+
+    # short buffer: only the first len(buffer) bytes are read
+    buffer = bytearray(4)
+    assert storage.read_into(FILE_1, buffer) == 4
+    assert bytes(buffer) == b"hell"
+
+    buffer = bytearray(3)
+    assert storage.read_into(FILE_1, buffer, start_byte=6) == 3
+    assert bytes(buffer) == b"wor"
+
+    # reading past the end fills only what is left
+    buffer = bytearray(11)
+    assert storage.read_into(FILE_1, buffer, start_byte=6) == 5
+    assert bytes(buffer) == b"world\x00\x00\x00\x00\x00\x00"
+
+    del storage[FILE_1]
+    with pytest.raises(KeyError):
+        storage.read_into(FILE_1, bytearray(1))
+
+
 def check_cache_state(cache, expected_state):
     assert set(cache.dirty_keys) == expected_state[0]
     assert set(cache.lru_sizes.keys()) == expected_state[1]
@@ -132,6 +163,11 @@ def test_storage_provider(storage):
     check_storage_provider(storage)
 
 
+@enabled_storages
+def test_read_into(storage):
+    check_read_into(storage)
+
+
 @pytest.mark.slow
 @enabled_cache_chains
 def test_cache(cache_chain):
@@ -55,3 +55,26 @@ def test_get_large_header():
     # So calling a larger codepath that includes `get_header_from_url`
     ds = deeplake.load("hub://activeloop/hmdb51-train")
     assert ds.videos[0].shape == (75, 240, 560, 3)
+
+
+def test_parallel_sample_compression(monkeypatch):
+    from deeplake.core.chunk import sample_compressed_chunk
+
+    monkeypatch.setattr(sample_compressed_chunk, "SERIALIZE_PARALLEL", True)
+    ds = deeplake.dataset("mem://test_parallel_sample_compression")
+    ds.create_tensor(
+        "img", htype="image", sample_compression="png", max_chunk_size=2**20
+    )
+    # mixed-ndim batch: the grayscale samples exercise the num_dims
+    # initialization that must happen before the fan-out
+    arrs = [
+        np.random.randint(0, 255, (50 + i % 7, 40), dtype=np.uint8)
+        if i % 5 == 0
+        else np.random.randint(0, 255, (50 + i % 7, 40, 3), dtype=np.uint8)
+        for i in range(60)
+    ]
+    ds.img.extend(arrs)
+    assert len(ds.img) == 60
+    for i, arr in enumerate(arrs):
+        expected = arr.reshape(arr.shape + (1,)) if arr.ndim == 2 else arr
+        np.testing.assert_array_equal(ds.img[i].numpy(), expected)
@@ -5,12 +5,18 @@ from deeplake.core.linked_sample import LinkedSample
 from deeplake.core.sample import Sample
 from deeplake.core.tensor import Tensor
 from typing import Union, List, Any
-from itertools import chain
 
 import numpy as np
 
 import posixpath
-import bisect
+
+
+def _locate(cum_sizes: np.ndarray, idx: int):
+    """Maps a flat sample index to (batch index, index within batch)."""
+    i = int(np.searchsorted(cum_sizes, idx, side="right"))
+    if i == 0:
+        return i, idx
+    return i, idx - int(cum_sizes[i - 1])
 
 
 class TransformTensor:
@@ -22,6 +28,7 @@ class TransformTensor:
         self.idx = slice(None, None, None)
         self.numpy_only = True
         self.cum_sizes = []
+        self._cum_np = None
 
     def __len__(self):
         if self.numpy_only:
@@ -56,11 +63,11 @@ class TransformTensor:
     def _numpy_only_data(self):
         idx = self.idx
         if isinstance(idx, int):
-            i = bisect.bisect_right(self.cum_sizes, idx)
-            if i == 0:
-                j = idx
-            else:
-                j = idx - self.cum_sizes[i - 1]
+            if len(self.cum_sizes) == 1:
+                return self.items[0][idx]
+            if self._cum_np is None:
+                self._cum_np = np.asarray(self.cum_sizes, dtype=np.int64)
+            i, j = _locate(self._cum_np, idx)
             return self.items[i][j]
         return self.items[idx]
 
@@ -93,10 +100,13 @@ class TransformTensor:
 
     def non_numpy_only(self):
         if self.numpy_only:
-            items = list(chain(*self.items[:]))
-            self.items.clear()
-            self.items += items
+            new_items: List[Any] = []
+            extend = new_items.extend
+            for batch in self.items:
+                extend(batch)  # iterating an ndarray yields row views
+            self.items = new_items
             self.cum_sizes.clear()
+            self._cum_np = None
             self.numpy_only = False
 
     def _item_added(self, item):
@@ -129,6 +139,15 @@ class TransformTensor:
         """Extend tensor with a numpy array in a numpy-only tensor.
         Returns ``True`` if successful, ``False`` otherwise.
         """
+        if isinstance(items, (list, tuple)) and items:
+            first = items[0]
+            if isinstance(first, np.ndarray) and all(
+                isinstance(item, np.ndarray)
+                and item.shape == first.shape
+                and item.dtype == first.dtype
+                for item in items[1:]
+            ):
+                items = np.stack(items)
         if isinstance(items, np.ndarray):
             self.items.append(items)
 
@@ -137,6 +156,7 @@ class TransformTensor:
                 self.cum_sizes.append(len(items))
             else:
                 self.cum_sizes.append(self.cum_sizes[-1] + len(items))
+            self._cum_np = None
 
             self._item_added(items)
             return True
@@ -149,5 +169,19 @@ class TransformTensor:
             if self._extend_numpy(items):
                 return
 
+        if self.is_group:
+            raise TensorDoesNotExistError(self.name)
+        self.non_numpy_only()
+
+        # hoist invariant lookups out of the per-sample loop
+        add = self.items.append
+        notify = self.dataset.item_added if self.dataset.all_chunk_engines else None
         for item in items:
-            self.append(item)
+            try:
+                self._verify_item(item)
+                add(item)
+                if notify:
+                    notify(item)
+            except Exception as e:
+                self.items.clear()
+                raise SampleAppendError(self.name, item) from e
@@ -87,6 +87,36 @@ def get_empty_text_like_sample(htype: str):
         )
 
 
+def downcast_samples(samples: Any, storage_dtype: str) -> Any:
+    """Casts float samples wider than `storage_dtype` down to it.
+
+    Used at ingest when a tensor has opted in via
+    `TensorMeta.set_storage_dtype`. Handles ndarrays and Python floats
+    (including inside a flat list or tuple); other inputs such as
+    `deeplake.read` samples are returned unchanged.
+    """
+    target = np.dtype(storage_dtype)
+
+    def _downcast(sample):
+        if (
+            isinstance(sample, np.ndarray)
+            and sample.dtype.kind == "f"
+            and sample.dtype.itemsize > target.itemsize
+        ):
+            return sample.astype(target)
+        if (
+            isinstance(sample, float)
+            and target.kind == "f"
+            and target.itemsize < np.dtype(type(sample)).itemsize
+        ):
+            return target.type(sample)
+        return sample
+
+    if isinstance(samples, (list, tuple)):
+        return [_downcast(sample) for sample in samples]
+    return _downcast(samples)
+
+
 def intelligent_cast(
     sample: Any, dtype: Union[np.dtype, str], htype: str
 ) -> np.ndarray:
@@ -1,6 +1,29 @@
-from uuid import uuid4
+import os
+import threading
+from typing import Dict, List
+
+import numpy as np
+
+# number of ids buffered per os.urandom call
+_ID_POOL_SIZE = 4096
+
+# dtype -> [pool array, cursor]. Ids are drawn from the pool and the pool is
+# refilled in bulk, so the kernel CSPRNG is hit once per _ID_POOL_SIZE ids
+# instead of once per id (as uuid4 would).
+_id_pools: Dict[type, List] = {}
+
+# threaded transforms generate chunk ids concurrently; guard the cursor so
+# two workers can't draw the same id
+_id_pools_lock = threading.Lock()
 
 
 def generate_id(dtype: type):
-    shift = 128 - (8 * dtype(1).itemsize)
-    return dtype(uuid4().int >> shift)
+    with _id_pools_lock:
+        pool_entry = _id_pools.get(dtype)
+        if pool_entry is None or pool_entry[1] >= _ID_POOL_SIZE:
+            itemsize = dtype(1).itemsize
+            pool = np.frombuffer(os.urandom(itemsize * _ID_POOL_SIZE), dtype=dtype)
+            pool_entry = _id_pools[dtype] = [pool, 0]
+        pool, idx = pool_entry
+        pool_entry[1] = idx + 1
+    return dtype(pool[idx])
@@ -1,8 +1,10 @@
+from functools import lru_cache
 from deeplake.util.exceptions import InvalidHubPathException
 from typing import Tuple
 import deeplake
 
 
+@lru_cache(maxsize=None)
 def process_hub_path(path: str) -> Tuple[str, str, str, str]:
     """Checks whether path is a valid Deep Lake cloud path."""
     # Allowed formats:
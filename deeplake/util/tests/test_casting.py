@@ -0,0 +1,33 @@
+import numpy as np
+
+import deeplake
+from deeplake.util.casting import downcast_samples
+
+
+def test_downcast_samples():
+    arr = np.random.rand(5, 3)
+    out = downcast_samples(arr, "float16")
+    assert out.dtype == np.float16
+    np.testing.assert_array_equal(out, arr.astype(np.float16))
+
+    # already at or below the target width: unchanged
+    half = arr.astype(np.float16)
+    assert downcast_samples(half, "float16") is half
+    assert downcast_samples(np.arange(5), "float16").dtype == np.int64
+
+    # python floats, alone and inside a flat list
+    assert isinstance(downcast_samples(1.5, "float16"), np.float16)
+    out = downcast_samples([1.5, np.random.rand(3)], "float16")
+    assert isinstance(out[0], np.float16)
+    assert out[1].dtype == np.float16
+
+
+def test_storage_dtype_roundtrip(memory_ds):
+    ds = memory_ds
+    ds.create_tensor("emb")
+    ds.emb.meta.set_storage_dtype("float16")
+    arr = np.random.rand(10, 4)  # float64
+    ds.emb.extend(arr)
+    assert ds.emb.dtype == np.float16
+    assert ds.emb.numpy().dtype == np.float16
+    np.testing.assert_array_equal(ds.emb.numpy(), arr.astype(np.float16))
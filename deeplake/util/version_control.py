@@ -1094,6 +1094,13 @@ def load_meta(dataset):
     _tensor_names.clear()
     _tensor_names.update(meta.tensor_names)
 
+    # warm the cache with all tensor metas in one batched fetch so that the
+    # tensor constructions below don't each pay a storage round trip
+    commit_id = version_state["commit_id"]
+    storage.prefetch(
+        [get_tensor_meta_key(key, commit_id) for key in _tensor_names.values()]
+    )
+
     for tensor_key in _tensor_names.values():
         if tensor_key.startswith("__temp"):
             dataset._temp_tensors.append(tensor_key)